@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 import pygame as pyg
 
 code_path = os.path.dirname(os.path.abspath(__file__))
@@ -24,6 +25,7 @@ suit_map = {
     "d": 0, "c": 1, "h": 2, "s": 3,
 }
 
+@lru_cache(maxsize=None) #Load each size once and share it, as the same few sizes are asked for all over the game
 def text_font(size):
         return pyg.font.Font(text_font_path, size)
 
@@ -309,8 +309,7 @@ class DealerRoom:
         Parameters:
             event (pyg.event.Event): A pygame event, such as a mouse click or keypress.
         """
-        for child in self.__UIManager.children:
-            child.handle_event(event)
+        self.__UIManager.handle_event(event)
 
     def handle_card_selection(self, mouse_pos):
         """
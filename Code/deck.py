@@ -7,55 +7,47 @@ class Deck:
     A class representing a standard deck of playing cards.
 
     Attributes:
-        __base_deck (list): A list containing the original 52-card deck.
-        __deck (list): A list containing the current shuffled deck.
+        __deck (list): A list containing the cards left in the deck, shuffled as they are drawn.
+        _base_deck_template (tuple): The 52 cards of a standard deck, created by the first reset_deck and reused by every Deck.
     """
+    #Only the current deck is stored per instance, the 52 base cards are shared through _base_deck_template
+    __slots__ = ('_Deck__deck',)
+    _base_deck_template = None
+
     def __init__(self):
-        """Initialises a Deck object with a standard deck of 52 cards and shuffles it."""
-        self.__base_deck = self._generate_base_deck()
+        """Initialises an empty Deck object, filled with the standard 52 cards by reset_deck."""
         self.__deck = []
 
-    def _generate_base_deck(self):
-        """
-        Generates a standard deck of 52 cards.
-
-        Returns:
-            list: A list containing the 52-card deck.
-
-        """
-        deck = []
-        for rank in rank_map_id:
-            for suit in suit_map:
-                if suit.isupper():
-                    deck.append(PlayingCard(f"{rank}{suit}"))
-        return deck
-
     def reset_deck(self):
         """
-        Resets the deck to the original base configuration and shuffles it.
+        Resets the deck to the original base configuration.
 
-        Raises:
-            ValueError: If the base deck is not initialized.
+        The deck is shuffled lazily as cards are drawn, so only the cards actually dealt
+        in a round cost a random swap instead of shuffling all 52 up front.
         """
-        self.__deck = list(self.__base_deck)
-        self.shuffle()
-
+        self.__deck = list(Deck._get_base_deck_template())
 
-    def shuffle(self):
+    @classmethod
+    def _get_base_deck_template(cls):
         """
-        Shuffles the deck in place.
+        Gets the 52 cards of a standard deck, creating them the first time they are needed
+        so importing this module does not load any card images.
 
-        Raises:
-            ValueError: If the deck is empty and cannot be shuffled.
+        Returns:
+            tuple: The cards of a standard deck.
         """
-        if not self.__deck:
-            raise ValueError("Deck is empty, cannot shuffle.")
-        random.shuffle(self.__deck)
+        if cls._base_deck_template is None:
+            #Cards are built straight from their IDs so no notation strings are formatted and parsed again
+            cls._base_deck_template = tuple(PlayingCard(rank_id * 4 + suit_id) for rank_id in rank_map_id.values() for suit, suit_id in suit_map.items() if suit.isupper())
+        return cls._base_deck_template
 
     def draw_from_top(self):
         """
         Deals a card from the top of the deck.
 
+        Each draw performs one step of a Fisher-Yates shuffle, swapping a random remaining
+        card to the top before drawing it, so the cards come out in a uniformly random order.
+
         Returns:
             PlayingCard: The dealt card object.
 
@@ -64,7 +56,10 @@ class Deck:
         """
         if not self.__deck:
             raise ValueError("No more cards in the deck")
-        card = self.__deck.pop(0)
+        #The end of the list is the top of the deck, so drawing does not shift the remaining cards
+        index = random.randrange(len(self.__deck))
+        self.__deck[index], self.__deck[-1] = self.__deck[-1], self.__deck[index]
+        card = self.__deck.pop()
         return card
 
     def deal_cards(self, hand):
@@ -83,6 +78,8 @@ class Deck:
         """
         Gets the current deck of cards.
 
+        The order is only randomised as cards are drawn, so the remaining cards are not in a shuffled order.
+
         Returns:
             list: The list of cards in the deck.
         """
@@ -1,6 +1,7 @@
 import pygame as pyg
 import random
 import os
+from collections import deque
 from typing import override
 from .card import Card
 from .CONSTANTS import (
@@ -375,15 +376,76 @@ class CategoryNode:
         self.jokers.append(joker)
         self.weight += weight
 
-    def remove_joker_from_category(self, joker, weight):
-        self.jokers.remove(joker)
-        self.weight -= weight
+    def pop_random_joker(self):
+        """
+        Removes a random Joker card from the category and updates its weight.
+
+        Returns:
+            JokerCard: The removed Joker card.
+        """
+        #Swap the chosen joker to the end so it can be popped without shifting the list
+        jokers = self.jokers
+        index = random.randrange(len(jokers))
+        jokers[index], jokers[-1] = jokers[-1], jokers[index]
+        joker = jokers.pop()
+        self.weight -= joker._weight
+        return joker
+
+def _build_alias(weights):
+    """
+    Builds the probability and alias columns for a list of weights using Vose's alias method.
+
+    Parameters:
+        weights (list): The positive weights of each item, with a total above 0.
+
+    Returns:
+        tuple: The list of probabilities of keeping each column and the list of alias columns.
+    """
+    number_of_weights = len(weights)
+    total_weight = sum(weights)
+    #Scale weights so the average is 1, then split columns into under-full and over-full
+    scaled_weights = [weight * number_of_weights / total_weight for weight in weights]
+    probabilities = [1.0] * number_of_weights
+    aliases = list(range(number_of_weights))
+    small = deque(i for i, weight in enumerate(scaled_weights) if weight < 1)
+    large = deque(i for i, weight in enumerate(scaled_weights) if weight >= 1)
+    while small and large:
+        #Fill the under-full column with the remainder from an over-full one
+        less = small.popleft()
+        more = large.popleft()
+        probabilities[less] = scaled_weights[less]
+        aliases[less] = more
+        scaled_weights[more] = scaled_weights[more] + scaled_weights[less] - 1
+        if scaled_weights[more] < 1:
+            small.append(more)
+        else:
+            large.append(more)
+    #Any leftovers are only off from 1 due to floating point rounding so they are always kept
+    return probabilities, aliases
+
+def _alias_sample(probabilities, aliases, column, chance):
+    """
+    Picks an item from an alias table given a uniformly chosen column and a uniform number in [0, 1).
+
+    Parameters:
+        probabilities (list): The probability of keeping each column.
+        aliases (list): The alias column to use when a column is not kept.
+        column (int): The randomly chosen column.
+        chance (float): The random number deciding whether to keep the column.
+
+    Returns:
+        int: The index of the selected item.
+    """
+    if chance < probabilities[column]:
+        return column
+    return aliases[column]
 
 class JokerTree:
     """Manages a hierarchy of Joker card categories and allows weighted selection for the shop."""
     def __init__(self):
         self.root = CategoryNode("Root", 0)
         self.categories = {}
+        self._alias_table = None
 
     def add_category(self, category_node):
         """
@@ -395,6 +457,7 @@ class JokerTree:
         category_node.parent = self.root
         self.categories[category_node.rarity] = category_node
         self.update_weights(category_node)
+        self.reset_alias_table()
 
     def add_joker(self, joker):
         """
@@ -407,12 +470,7 @@ class JokerTree:
             category = self.categories[joker._rarity]
             category.add_joker_to_category(joker, joker._weight)
             self.update_weights(category)
-
-    def remove_joker(self, joker):
-        if joker._rarity in self.categories:
-            category = self.categories[joker._rarity]
-            category.remove_joker_from_category(joker, joker._weight)
-            self.update_weights(category)
+            self.reset_alias_table()
 
     def update_weights(self, node):
         """
@@ -428,6 +486,26 @@ class JokerTree:
                 node.parent.weight = sum(category.weight for category in self.categories.values())
             node = node.parent  #Move up to update all ancestors up to root
 
+    def reset_alias_table(self):
+        """Drops the alias table so the next selection builds it from the current category weights."""
+        self._alias_table = None
+
+    def build_alias_table(self):
+        """
+        Builds an alias table from the current category weights using Vose's alias method.
+
+        Each category gets a probability of being kept and an alias category to use otherwise,
+        so a weighted selection only needs one random index and one random number.
+        """
+        #Categories that have run out of jokers are left out so they can never be picked
+        categories = [category for category in self.categories.values() if category.jokers and category.weight > 0]
+        weights = [category.weight for category in categories]
+        if not categories:
+            self._alias_table = ([], [], [])
+            return
+        probabilities, aliases = _build_alias(weights)
+        self._alias_table = (categories, probabilities, aliases)
+
     def weighted_select_joker(self):
         """
         Selects a Joker card based on weighted random selection.
@@ -435,17 +513,17 @@ class JokerTree:
         Returns:
             JokerCard: The randomly selected Joker card.
         """
-        #Calculate the total cumulative weight across all categories and generate a random number within the range of the total weight.
-
-        random_num = random.uniform(0, self.root.weight)
-        #Now iterate through the categories to find the one corresponding to the random number.
-        for category in self.categories.values():
-            #If the random number is less than the category's cumulative weight then choose it.
-            print(f"Category {category.rarity} has weights {category.weight}")
-            if random_num < category.weight:
-                joker = random.choice(category.jokers)
-                self.remove_joker(joker)
-                return joker #Returns a random joker in that category
-            #Reduce randoom_num by the current category's cumulative weight, to look in the remaining range.
-            random_num -= category.weight
-        return None
+        if self._alias_table is None:
+            self.build_alias_table()
+        categories, probabilities, aliases = self._alias_table
+        if not categories:
+            return None
+        #Pick a column uniformly, then either keep it or take its alias
+        index = _alias_sample(probabilities, aliases, random.randrange(len(categories)), random.random())
+        category = categories[index]
+        joker = category.pop_random_joker()
+        self.update_weights(category)
+        #The table is built once per set of level weights, so it is only rebuilt early if a category runs out of jokers
+        if not category.jokers:
+            self.reset_alias_table()
+        return joker #Returns a random joker in that category
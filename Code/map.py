@@ -1,4 +1,5 @@
 import random
+from itertools import chain, repeat
 import pygame as pyg
 from .CONSTANTS import (
     DISPLAY_DIMENSIONS_X,
@@ -10,19 +11,45 @@ from .CONSTANTS import (
 
 
 
+def _largest_remainder(proportions, total):
+    """
+    Splits a total into whole counts following the given proportions using the largest remainder method.
+
+    Parameters:
+        proportions (tuple): The proportion of the total for each count, adding up to 1.
+        total (int): The total the counts must add up to.
+
+    Returns:
+        list: The count for each proportion, in the same order.
+    """
+    raw_counts = [proportion * total for proportion in proportions]
+    counts = [round(raw_count) for raw_count in raw_counts]
+    difference = total - sum(counts)
+    if difference != 0:
+        #Order by fractional parts. Descending when adding to counts, ascending when removing.
+        order = sorted(range(len(counts)), key=lambda i: raw_counts[i] % 1, reverse=(difference > 0))
+        step = 1 if difference > 0 else -1
+        for i in order[:abs(difference)]:
+            counts[i] += step
+    return counts
+
 
 class GraphNode:
     """
     Represents a node within the graph, used to define rooms and connections on the map.
 
     Attributes:
-        __id (int): The unique identifier of each node
+        _id (int): The unique identifier of each node
         _x (int): The x coordinate of the node's position.
         _y (int): The y coordinate of the node's position.
         _room_type (str): The type of room (e.g., "D" for dealer, "B" for boss).
         _level (int): The level of the node in the map.
         edges (list): List of connected nodes.
+        _edge_set (set): The connected nodes, for fast membership checks.
     """
+    #There are a couple of hundred nodes per map, so avoid giving each one a __dict__
+    __slots__ = ('_id', '_x', '_y', '_room_type', '_level', 'edges', '_edge_set', 'visited')
+
     def __init__(self, x ,y, level):
         """
         Initialises a GraphNode object with coordinates, level, and default values for ID and room type.
@@ -32,12 +59,13 @@ class GraphNode:
         y (int): The y-coordinate of the node's position.
         level (int): The level of the node in the map.
         """
-        self.__id = None
+        self._id = None
         self._x = x
         self._y = y
         self._room_type = None
         self._level = level
         self.edges = []
+        self._edge_set = set()
         self.visited = False
 
     def visit(self, rooms, current_level, dealer_type):
@@ -52,6 +80,7 @@ class GraphNode:
             connected_node (GraphNode): The node to connect to.
         """
         self.edges.append(connected_node)
+        self._edge_set.add(connected_node)
 
     @property
     def x(self):
@@ -88,7 +117,7 @@ class GraphNode:
     @property
     def id(self):
         """Returns the node's ID."""
-        return self.__id
+        return self._id
 
     @id.setter
     def id(self, id):
@@ -98,7 +127,7 @@ class GraphNode:
         Parameters:
             id (int): The unique identifier to set for the node.
         """
-        self.__id = id
+        self._id = id
     @property
     def level(self):
         """
@@ -136,12 +165,16 @@ class Graph:
         __nodes (dict): A dictionary of nodes in the graph, indexed by node ID.
         edges (list): A list of edges between nodes.
         __next_id (int): The ID to be assigned to the next node.
+        _connected (set): The nodes that have at least one edge.
+        _edge_keys (set): The (smaller ID, larger ID) pair of every edge, used to skip duplicate edges.
     """
     def __init__(self):
         """Initialises a new Graph instance with empty nodes and edges."""
         self.__nodes = {}
         self.edges = []
         self.__next_id = 0
+        self._connected = set()
+        self._edge_keys = set()
 
     @property
     def next_id(self):
@@ -163,6 +196,15 @@ class Graph:
         """Returns the values (GraphNode instances) of the nodes in the graph."""
         return self.__nodes.values()
 
+    def __len__(self):
+        """
+        Gets the number of nodes in the graph.
+
+        Returns:
+            int: The number of nodes in the graph.
+        """
+        return len(self.__nodes)
+
     def add_node(self, node):
         """
         Adds a node to the graph and assigns it a unique ID.
@@ -174,19 +216,15 @@ class Graph:
         self.__nodes[node.id] = node
         self.__next_id += 1
 
-    def remove_node(self, node_id):
-        """
-        Removes a node from the graph by its ID.
-
-        Parameters:
-            node_id (int): The ID of the node to remove.
-        """
-        if node_id in self.__nodes:
-            self.__nodes.pop(node_id)
+    def remove_unconnected_nodes(self):
+        """Removes every node that has no edges from the graph in a single pass."""
+        connected = self._connected
+        self.__nodes = {node_id: node for node_id, node in self.__nodes.items() if node in connected}
 
     def add_edge(self, from_node, to_node):
         """
         Adds an edge between two nodes, establishing a connection.
+        Paths often share edges, so an edge that already exists is not added again.
 
         Parameters:
             from_node (GraphNode): The starting node of the edge.
@@ -195,10 +233,19 @@ class Graph:
         Raises:
             Exception: If one or both nodes are not in the graph.
         """
-        if from_node in self.__nodes.values() and to_node in self.__nodes.values():
+        if from_node._id in self.__nodes and to_node._id in self.__nodes:
+            if from_node.id < to_node.id:
+                key = (from_node.id, to_node.id)
+            else:
+                key = (to_node.id, from_node.id)
+            if key in self._edge_keys:
+                return
+            self._edge_keys.add(key)
             from_node.add_edge(to_node)
             to_node.add_edge(from_node)
             self.edges.append((from_node, to_node))
+            self._connected.add(from_node)
+            self._connected.add(to_node)
         else:
             raise Exception(f"One or both nodes not in graph: {from_node.id}, {to_node.id}")
 
@@ -212,13 +259,14 @@ class MapGenerator:
         _rows (int): The number of rows in the map.
         _cols (int): The number of columns in the map.
         __num_of_paths (int): The number of paths to be generated.
-        _first_level_chosen_nodes (set): Set of nodes chosen from the first level.
-        _nodes_after_first_boss (set): Set of nodes chosen after the first boss.
+        _next_node_pools (dict): Shuffled IDs of the unchosen nodes above the starting and boss nodes, indexed by their ID.
         __starting_node (GraphNode): The starting node of the map.
         __boss_node (GraphNode): The boss node in the map.
         __end_node (GraphNode): The end node in the map.
         __least_x (int): The least x coordinate of all nodes.
         __greatest_x (int): The greatest x coordinate of all nodes.
+        _nodes_by_level (dict): Lists of the nodes on each level, indexed by level.
+        _forced_next (dict): The only node each level 10 and level 21 node can connect to, indexed by node ID.
     """
     def __init__(self):
         """Initialises the MapGenerator and starts generating the map."""
@@ -227,12 +275,14 @@ class MapGenerator:
         self._rows = 10
         self._cols = 10
         self.__num_of_paths = 5
-        self._nodes_not_to_connect_to = set()
+        self._next_node_pools = {}
         self.__starting_node = None
         self.__boss_node = None
         self.__end_node = None
         self.__least_x = DISPLAY_DIMENSIONS_X
         self.__greatest_x = 0
+        self._nodes_by_level = {}
+        self._forced_next = {}
         self.generate_graph()
 
     @property
@@ -240,6 +290,11 @@ class MapGenerator:
         """Returns the graph representing the map."""
         return self._graph
 
+    @property
+    def nodes_by_level(self):
+        """Returns the lists of nodes on each level, indexed by level."""
+        return self._nodes_by_level
+
     @property
     def starting_node(self):
         """Returns the starting node of the map."""
@@ -306,26 +361,32 @@ class MapGenerator:
         self._graph.add_node(new_starting_node)
         self.starting_node = new_starting_node
 
+        #Values that are the same for every node are worked out once rather than in the loops
+        graph = self._graph
+        uniform = random.uniform
+        x_spread = DISPLAY_DIMENSIONS_X * 0.01
+        y_spread = DISPLAY_DIMENSIONS_Y * 0.01
+        col_width = 1 / 10 * DISPLAY_DIMENSIONS_X
+        row_height = 1 / 13 * DISPLAY_DIMENSIONS_Y
+        col_xs = [(col * col_width) + (DISPLAY_DIMENSIONS_X / 20) for col in range(self._cols)]
+
         #Generate 100 nodes (levels 1-10)
-        for index in range(self._rows * self._cols):
-            level = (index // 10) + 1
-            row = index // 10
-            col = index % 10
-            #Offsets take the nodes look less fixed in place
-            x_offset = random.uniform(-DISPLAY_DIMENSIONS_X * 0.01, DISPLAY_DIMENSIONS_X * 0.01)
-            y_offset = random.uniform(-DISPLAY_DIMENSIONS_Y * 0.01, DISPLAY_DIMENSIONS_Y * 0.01)
-            #Calculate base position
-            x = ((col * (1 / 10 * DISPLAY_DIMENSIONS_X)) + (DISPLAY_DIMENSIONS_X / 20)) + x_offset
+        for row in range(self._rows):
+            level = row + 1
             #Calculate y position based on row, ensuring it stays within the first half of the screen
-            y = ((row * (1 / 13 * DISPLAY_DIMENSIONS_Y)) + (DISPLAY_DIMENSIONS_Y / 13)) + y_offset
-            x = round(x)
-            y = round(y)
-            self._graph.add_node(GraphNode(x, y, level))
-
-            if x < self.__least_x:
-                self.__least_x = x
-            if x > self.__greatest_x:
-                self.__greatest_x = x
+            row_y = (row * row_height) + (DISPLAY_DIMENSIONS_Y / 13)
+            for col_x in col_xs:
+                #Offsets take the nodes look less fixed in place
+                x_offset = uniform(-x_spread, x_spread)
+                y_offset = uniform(-y_spread, y_spread)
+                x = round(col_x + x_offset)
+                y = round(row_y + y_offset)
+                graph.add_node(GraphNode(x, y, level))
+
+                if x < self.__least_x:
+                    self.__least_x = x
+                if x > self.__greatest_x:
+                    self.__greatest_x = x
 
         #Add only one boss node on level 11 so all nodes on level 10 must connect to this
         boss_x = round((self.__greatest_x + self.__least_x) / 2)
@@ -335,20 +396,18 @@ class MapGenerator:
         self.boss_node = boss_node
 
         #Generate second set of 100 nodes (levels 12-21)
-        for index in range(self._rows*self._cols):
-            level = (index // 10) + 12
-            row = index // 10
-            col = index % 10
-            x_offset = random.uniform(-DISPLAY_DIMENSIONS_X * 0.01, DISPLAY_DIMENSIONS_X * 0.01)
-            y_offset = random.uniform(-DISPLAY_DIMENSIONS_Y * 0.01, DISPLAY_DIMENSIONS_Y * 0.01)
-            x = ((col * (1 / 10 * DISPLAY_DIMENSIONS_X)) + (DISPLAY_DIMENSIONS_X / 20)) + x_offset
-            base_y = (11/13) * DISPLAY_DIMENSIONS_Y # Start after the boss node
+        base_y = (11/13) * DISPLAY_DIMENSIONS_Y # Start after the boss node
+        for row in range(self._rows):
+            level = row + 12
             relative_row = row + 1  # Add 1 to account for the boss node
-            y = base_y + (relative_row * (1 / 13 * DISPLAY_DIMENSIONS_Y)) + y_offset
-            x = round(x)
-            y = round(y)
+            row_y = base_y + (relative_row * row_height)
+            for col_x in col_xs:
+                x_offset = uniform(-x_spread, x_spread)
+                y_offset = uniform(-y_spread, y_spread)
+                x = round(col_x + x_offset)
+                y = round(row_y + y_offset)
 
-            self._graph.add_node(GraphNode(x, y, level))
+                graph.add_node(GraphNode(x, y, level))
 
         final_boss_x = start_x
         final_boss_y = round((23/13) * DISPLAY_DIMENSIONS_Y)
@@ -356,6 +415,20 @@ class MapGenerator:
         self._graph.add_node(final_boss_node)
         self.end_node = final_boss_node
 
+        #Each path leaves the starting and boss nodes through a different node on the level above,
+        #so shuffle those nodes once and hand them out in turn
+        for from_node in (new_starting_node, boss_node):
+            pool = list(range(from_node.id + 1, from_node.id + 11))
+            random.shuffle(pool)
+            self._next_node_pools[from_node.id] = pool
+
+        #All level 10 nodes have to connect to the guarenteed boss room and level 21 nodes to the end node
+        for node in self._graph.nodes_values:
+            if node._level == 10:
+                self._forced_next[node._id] = boss_node
+            elif node._level == 21:
+                self._forced_next[node._id] = final_boss_node
+
     def find_next_node(self, current_node):
          """
         Finds the next node to connect to based on the current node's level and type.
@@ -366,20 +439,15 @@ class MapGenerator:
         Returns:
             GraphNode: The next node to connect to based on rules.
         """
+         #Level 10 and level 21 nodes only have one node they can connect to
+         next_node = self._forced_next.get(current_node._id)
+         if next_node is not None:
+             return next_node
          nodes = self._graph.nodes
-         if current_node == self.__starting_node:
-            next_node = self.get_any_node_above(self.__starting_node, nodes)
-         elif current_node == self.__boss_node:
-             next_node = self.get_any_node_above(self.__boss_node, nodes)
-         elif current_node.level == 10:
-             #All nodes have to connect to the guarenteed boss room
-             next_node = self.__boss_node
-         elif current_node.level == 21: #Last row so needs to connect to end node
-            next_node = self.get_end_node(nodes)
+         if current_node is self.__starting_node or current_node is self.__boss_node:
+            next_node = self.get_any_node_above(current_node, nodes)
          else:
             next_node = self.get_node_on_above_level(current_node, nodes)
-
-
          return next_node
 
     def get_any_node_above(self, from_node, nodes):
@@ -393,24 +461,8 @@ class MapGenerator:
             GraphNode: A unique node from level 1 that is connected after the starting node.
         """
         #Choose any node after on the floor above. This is for after the starting node or boss node.
-        #Allows unique paths
-        next_node_id = random.randint(from_node.id + 1, from_node.id + 10)
-        while nodes[next_node_id] in self._nodes_not_to_connect_to: #If the chosen node has already been chosen, reselect
-            next_node_id = random.randint(from_node.id + 1, from_node.id + 10)
-        self._nodes_not_to_connect_to.add(nodes[next_node_id])
-        return nodes[next_node_id]
-
-    def get_end_node(self, nodes):
-        """
-        Connects level 21 nodes to the final boss on level 22.
-
-        Parameters:
-            nodes (dict): A dictionary of all nodes in the graph.
-
-        Returns:
-            GraphNode: The end node (boss node) at level 22.
-        """
-        next_node_id = self.__end_node.id
+        #Allows unique paths as each node in the pool is only handed out once
+        next_node_id = self._next_node_pools[from_node.id].pop()
         return nodes[next_node_id]
 
     def get_node_on_above_level(self, current_node, nodes):
@@ -464,9 +516,9 @@ class MapGenerator:
         path.append(self.__starting_node)
         current_node = path[-1]
         #Create a path from starting node to the end node adding edges in between the nodes.
-        while current_node != self.__end_node:
+        while current_node is not self.__end_node:
             next_node = self.find_next_node(current_node)
-            if next_node == self.__end_node:
+            if next_node is self.__end_node:
                 self._graph.add_edge(current_node, next_node)
                 break
 
@@ -480,12 +532,10 @@ class MapGenerator:
         """
         Removes nodes from the graph that have no connections (edges).
 
-        This method iterates through all nodes in the graph and finds
-        any nodes that are not connected to any other nodes, removing them from the graph.
+        The graph keeps track of which nodes have been given an edge, so any
+        node not connected to any other node is filtered out in one pass.
         """
-        for node_id, node in list(self._graph.nodes.items()):
-            if len(node.edges) == 0:  #If the node has no edges, remove it
-                self._graph.remove_node(node_id)
+        self._graph.remove_unconnected_nodes()
 
 
     def assign_room_types(self):
@@ -497,8 +547,9 @@ class MapGenerator:
         """
 
         bucket = self.create_room_type_bucket()
+        nodes = list(self._graph.nodes_values)
         #Assign predetermined rooms
-        for node in self._graph.nodes_values:
+        for node in nodes:
             #0th and first floor is a guarenteed dealer room
             if node.level == 0 or node.level == 1:
                 node.room_type = "D"
@@ -507,11 +558,10 @@ class MapGenerator:
             elif node.level == 11 or node.level == 22:
                 node.room_type = "B"
         #Iterate through remaining rooms that do not have a room type
-        for node in self._graph.nodes_values:
+        for node in nodes:
             if node.room_type is None:
                 room_type = self.get_valid_room_type(node, bucket)
                 node.room_type = room_type
-                print(f"{node.id} has no room type, assinging {node.room_type}")
                 #Found a valid room type so remove it from the bucket
                 if room_type in bucket:
                     bucket.remove(room_type)
@@ -527,18 +577,11 @@ class MapGenerator:
         Returns:
             str: A valid room type for the node, defaults to "D" if none found.
         """
-        reward_room_below= self.check_previous_floor_types(node)
-        for room_type in bucket:
-            if reward_room_below:
-                #There was a reward room below, so must be a dealer next
-                return "D"
-            if reward_room_below and room_type == "R":
-                #Do not want to put 2 reward rooms in a row so continue
-                continue
-            return room_type
-
-        #If no valid room type is found, default to "D" (dealer room)
-        return "D"
+        if self.check_previous_floor_types(node):
+            #There was a reward room below, so must be a dealer next
+            return "D"
+        #Take the next room type in the bucket. If it is empty, default to "D" (dealer room)
+        return bucket[0] if bucket else "D"
 
     def check_previous_floor_types(self, node):
         """
@@ -551,13 +594,10 @@ class MapGenerator:
             bool: True if a reward room is found below, False otherwise.
         """
         #Checking if a reward room is below so that the map does not put 2 rewards in a row
-        is_reward_room = False
         for neighbour in node.edges:
-            if neighbour.level < node.level:
-                if neighbour.room_type == "R":
-                    is_reward_room = True
-
-        return is_reward_room
+            if neighbour._level < node._level and neighbour._room_type == "R":
+                return True #No need to check the rest once one is found
+        return False
 
     def create_room_type_bucket(self):
         """
@@ -567,39 +607,11 @@ class MapGenerator:
             list: A list of room types available for use.
         """
         #Exclude the last node as it is a boss
-        num_nodes = len(self._graph.nodes_values) - 1
-        room_types = [
-        {"name": "R", "proportion": 0.1},
-        {"name": "?", "proportion": 0.45},
-        {"name": "D", "proportion": 0.45}
-        ]
-
-        total_rooms = 0
-        for room in room_types:
-            raw_count = room["proportion"] * num_nodes
-            room["rounded_count"] = round(raw_count) #Adds the room count
-            room["fractional_part"] = raw_count % 1 #Adds the fractional part
-            total_rooms += room["rounded_count"]
-
-        difference = num_nodes - total_rooms
-
-        def get_fractional_part(room):
-            return room["fractional_part"]
-
-        if difference != 0:
-            #Sort the list based on fractional parts. Descending when adding rooms, ascending when removing.
-            room_types.sort(key=get_fractional_part, reverse=(difference > 0))
-            for i in range(abs(difference)):
-                if difference > 0:
-                    #Add one room to the type with the highest fractional part
-                    room_types[i]["rounded_count"] += 1
-                else:
-                    #Remove one room from the type with the lowest fractional part
-                    room_types[i]["rounded_count"] -= 1
-        #Create bucket of room types now and shuffle it
-        bucket = []
-        for room in room_types:
-            bucket.extend([room["name"]] * room["rounded_count"])
+        num_nodes = len(self._graph) - 1
+        room_names = ("R", "?", "D")
+        room_counts = _largest_remainder((0.1, 0.45, 0.45), num_nodes)
+        #Create bucket of room types in one pass now and shuffle it
+        bucket = list(chain.from_iterable(repeat(name, count) for name, count in zip(room_names, room_counts)))
         random.shuffle(bucket)
         return bucket
 
@@ -609,6 +621,9 @@ class MapGenerator:
         self.generate_paths()
         self.remove_unconnected_nodes()
         self.assign_room_types()
+        #Group the remaining nodes by level so lookups can skip levels out of view
+        for node in self._graph.nodes_values:
+            self._nodes_by_level.setdefault(node._level, []).append(node)
 
 class MapVisualiser:
     """
@@ -622,7 +637,18 @@ class MapVisualiser:
         current_level (int): The current level being visualised.
         completed_nodes (list): A list of nodes that have been completed.
         __font (pyg.font.Font): The font used for rendering text.
+        __labels (dict): The rendered label for each room type, indexed by room type.
         __circle_size (int): The size of the circles representing nodes.
+        __y_scale (float): The vertical distance between levels on screen.
+        __y_offset (int): The vertical offset keeping the top level's circles on screen.
+        _nodes (tuple): The nodes of the map in draw order.
+        _node_xs (tuple): The x coordinate of each node in _nodes.
+        _node_levels (tuple): The level of each node in _nodes.
+        _edge_indices (tuple): The pair of indexes into _nodes for each edge.
+        _pos_cache (tuple): The scaled draw position of each node in _nodes.
+        _pos_cache_key (tuple): The (current_level, scroll_level) the position cache was built for.
+        _colour_cache (tuple): The colour of each node in _nodes.
+        _colour_cache_key (tuple): The IDs of the current node and last completed node the colour cache was built for.
 
     Parameters:
         map_generator (MapGenerator): An instance of the map generator.
@@ -636,8 +662,24 @@ class MapVisualiser:
         self.current_level = 0
         self.completed_nodes = []
         self.__font = text_font(20)
+        #There are only four room types, so render their labels once instead of every frame
+        self.__labels = {room_type: self.__font.render(room_type, True, (255, 255, 255)) for room_type in "D?RB"}
         self.__circle_size = 20
+        self.__y_scale = DISPLAY_DIMENSIONS_Y / 10
+        self.__y_offset = self.__circle_size + 1
         self.scroll_level = 0
+        #The map does not change once generated, so keep its coordinates and levels in flat tuples
+        #rather than reading them off each node whenever the view moves
+        nodes = tuple(self._graph.nodes_values)
+        node_indices = {node._id: index for index, node in enumerate(nodes)}
+        self._nodes = nodes
+        self._node_xs = tuple(round(node._x) for node in nodes)
+        self._node_levels = tuple(node._level for node in nodes)
+        self._edge_indices = tuple((node_indices[node1._id], node_indices[node2._id]) for node1, node2 in self._graph.edges)
+        self._pos_cache = ()
+        self._pos_cache_key = None
+        self._colour_cache = ()
+        self._colour_cache_key = None
 
     def visualise_graph(self, current_node):
         """
@@ -650,57 +692,77 @@ class MapVisualiser:
         Parameters:
             current_node (GraphNode): The current node being visualized.
         """
-        self.__display.fill((0, 0, 0))
+        display = self.__display
+        display.fill((0, 0, 0))
+        positions = self.get_draw_positions()
+        #Bound to locals as they are used for every edge and node
+        draw_line = pyg.draw.line
+        draw_circle = pyg.draw.circle
+        labels = self.__labels
 
         #Draw edges between nodes
-        for edge in self._graph.edges:
-            node1, node2 = edge
-            #Check if both nodes are within the current level view
-
-            #Scale positions for drawing
-            scaled_pos1 = self.scale_position(node1)
-            scaled_pos2 = self.scale_position(node2)
-            if self.scroll_level != 0:
-                scaled_pos1 = self.update_positions_after_scroll(node1)
-                scaled_pos2 = self.update_positions_after_scroll(node2)
+        for index1, index2 in self._edge_indices:
             #Draw a red line between nodes
-            pyg.draw.line(self.__display, (255, 0, 0), scaled_pos1, scaled_pos2, 2)
+            draw_line(display, (255, 0, 0), positions[index1], positions[index2], 2)
 
         #Draw nodes within the current level view
-        for node in self._graph.nodes_values:
-            #Scale position for current node
-            scaled_pos = self.scale_position(node)
-            if self.scroll_level != 0:
-                scaled_pos = self.update_positions_after_scroll(node)
-            colour = self.get_node_colour(node, current_node)
-            pyg.draw.circle(self.__display, colour, scaled_pos, 20)
-            label = self.__font.render(node.room_type, True, (255, 255, 255))
-            self.__display.blit(label, (scaled_pos[0] - 10, scaled_pos[1] - 10))
+        for node, scaled_pos, colour in zip(self._nodes, positions, self.get_node_colours(current_node)):
+            draw_circle(display, colour, scaled_pos, 20)
+            label = labels[node._room_type]
+            display.blit(label, (scaled_pos[0] - 10, scaled_pos[1] - 10))
+
+    def get_draw_positions(self):
+        """
+        Gets the scaled draw position of every node, only recalculating them when the view has moved.
+
+        Returns:
+            tuple: The (x, y) draw position of each node, in the same order as _nodes.
+        """
+        key = (self.current_level, self.scroll_level)
+        if key != self._pos_cache_key:
+            #Scrolling overrides the view of the current level
+            top_level = self.scroll_level if self.scroll_level != 0 else self.current_level
+            y_scale = self.__y_scale
+            y_offset = self.__y_offset
+            scaled_ys = (round((level - top_level) * y_scale + y_offset) for level in self._node_levels)
+            self._pos_cache = tuple(zip(self._node_xs, scaled_ys))
+            self._pos_cache_key = key
+        return self._pos_cache
+
+    def get_node_colours(self, current_node):
+        """
+        Gets the colour of every node, only recalculating them when the current or last completed node changes.
+
+        Parameters:
+            current_node (GraphNode): The current node being visualized.
+
+        Returns:
+            tuple: The colour of each node, in the same order as _nodes.
+        """
+        last_completed_id = self.completed_nodes[-1]._id if self.completed_nodes else None
+        key = (current_node._id, last_completed_id)
+        if key != self._colour_cache_key:
+            self._colour_cache = tuple(self.get_node_colour(node, current_node) for node in self._nodes)
+            self._colour_cache_key = key
+        return self._colour_cache
 
     def get_node_colour(self, node, current_node):
         """Determine the color based on node status."""
-        if node.id == current_node.id:
+        if node._id == current_node._id:
             return RED  #Red for current node
-        elif self.completed_nodes and node in self.completed_nodes[-1].edges:
-            if node.level > self.completed_nodes[-1].level:
+        elif self.completed_nodes and node in self.completed_nodes[-1]._edge_set:
+            if node._level > self.completed_nodes[-1]._level:
                 return GOLD #Gold for potential next nodes
 
         return BLUE  #Default blue for undiscovered nodes
 
     def scale_position(self, node):
         """Scale node position to fit current view window"""
-        x = node.x
+        x = node._x
         #Scale y position to fit within visible window
-        y = ((node.level - self.current_level) / 10) * DISPLAY_DIMENSIONS_Y + self.__circle_size + 1
+        y = (node._level - self.current_level) * self.__y_scale + self.__y_offset
         return (round(x), round(y))
 
-    def update_positions_after_scroll(self, node):
-        """Displays nodes that are now in view"""
-        x = node.x
-        y = ((node.level - self.scroll_level) / 10) * DISPLAY_DIMENSIONS_Y + self.__circle_size + 1
-        return (round(x), round(y))
-
-
     def handle_click(self, mouse_pos):
         """
         Handles mouse click events and returns the room (node) clicked on.
@@ -711,12 +773,16 @@ class MapVisualiser:
         Returns:
             node: The clicked room node if one was clicked, else None.
         """
-        #Check each node to see if it was clicked
-        for node in self._graph.nodes_values:
-            if self.current_level <= node.level <= self.current_level + 10:
-                scaled_pos = self.scale_position(node)
-                #Check if the click is within the node's radius
-                if pyg.Vector2(mouse_pos).distance_to(scaled_pos) < 20:
+        mouse_x, mouse_y = mouse_pos
+        nodes_by_level = self._map_generator.nodes_by_level
+        #Check each node in view to see if it was clicked
+        for level in range(self.current_level, self.current_level + 11):
+            for node in nodes_by_level.get(level, ()):
+                scaled_x, scaled_y = self.scale_position(node)
+                #Check if the click is within the node's radius, comparing squared distances to avoid a square root
+                dx = mouse_x - scaled_x
+                dy = mouse_y - scaled_y
+                if dx * dx + dy * dy < 400:
                     return node
 
         return None #Return None if no node was clicked
\ No newline at end of file
@@ -27,14 +27,14 @@ class PlayingCard(Card):
 
     def __init__(self, card):
         """
-        Initialises a Card object with the notation (e.g., '2H' for 2 of Hearts).
+        Initialises a Card object with the notation (e.g., '2H' for 2 of Hearts) or its ID.
         The card image is loaded and scaled to predefined dimensions.
 
         Parameters:
-            card (str): The card notation consisting of rank and suit (e.g., '2H').
+            card (str or int): The card notation consisting of rank and suit (e.g., '2H'), or the card's ID.
         """
         super().__init__(card)
-        self.__id = self.create_id(card)
+        self.__id = self._id #The ID is already worked out by Card
         self.__image = pyg.image.load(os.path.join(cards_path, f"{self.rank}{self.suit.upper()}.png"))
         self.__image = pyg.transform.scale(self.__image, (DISPLAY_DIMENSIONS_X//16, DISPLAY_DIMENSIONS_Y//6))
 
@@ -54,11 +54,14 @@ class PlayingCard(Card):
         Creates a unique identifier for the card based on its rank and suit.
 
         Parameters:
-            card (str): The card notation consisting of rank and suit.
+            card (str or int): The card notation consisting of rank and suit, or an already computed ID.
 
         Returns:
             int: The unique identifier of the card.
         """
+        #An integer is already an ID (rank_id * 4 + suit_id) so there is nothing to parse
+        if isinstance(card, int):
+            return card
         #Extract the rank (first character) and suit (last character) from the card
         rank = card[0]
         suit = card[1]
@@ -2,9 +2,67 @@
 This module defines classes and methods for evaluating a poker hand
 and managing the point scoring system.
 """
-from collections import Counter
+from functools import lru_cache
 from .CONSTANTS import rank_map_id
 
+#Base score and multiplier of each hand type at level 1
+BASE_HAND_VALUES = {
+    "High Card": (5, 1),
+    "One Pair": (10, 2),
+    "Two Pair": (20, 3),
+    "Three of a Kind": (35, 3),
+    "Straight": (50, 4),
+    "Flush": (55, 4),
+    "Full House": (60, 4),
+    "Four of a Kind": (75, 6),
+    "Straight Flush": (100, 8),
+    "Royal Flush": (100, 10),
+}
+
+@lru_cache(maxsize=128)
+def _base_score(hand_type, level):
+    """
+    Calculates the base score of a hand type at a given level.
+
+    Parameters:
+        hand_type (str): The type of hand.
+        level (int): The level of the hand type.
+
+    Returns:
+        int: The base score, with 20 score added for each level above 1.
+    """
+    return BASE_HAND_VALUES[hand_type][0] + 20*(level-1)
+
+@lru_cache(maxsize=128)
+def _base_multiplier(hand_type, level):
+    """
+    Calculates the base multiplier of a hand type at a given level.
+
+    Parameters:
+        hand_type (str): The type of hand.
+        level (int): The level of the hand type.
+
+    Returns:
+        int: The base multiplier, with 1 mult added for each level above 1.
+    """
+    return BASE_HAND_VALUES[hand_type][1] + (level-1)
+
+def _is_consecutive_descending(rank_ids):
+    """
+    Checks if each rank ID is exactly one lower than the one before it.
+
+    Parameters:
+        rank_ids (list): Rank IDs sorted in descending order.
+
+    Returns:
+        bool: True if the ranks are consecutive, False otherwise.
+    """
+    highest_rank_id = rank_ids[0]
+    for position, rank_id in enumerate(rank_ids):
+        if rank_id != highest_rank_id - position:
+            return False
+    return True
+
 
 class PokerEval:
     """
@@ -12,9 +70,11 @@ class PokerEval:
 
     Attributes:
         hand: An instance of the Hand class that has the cards to be evaluated
+        _last_eval: The (fingerprint, hand_type, cards) of the last evaluated hand
     """
     def __init__(self, hand):
         self.hand = hand
+        self._last_eval = None
 
     def sort_hand_by_rank(self):
         """Sorts the hand by rank of the cards. Order: A, K, Q, J, 10, 9, 8, 7, 6, 5, 4, 3, 2."""
@@ -50,23 +110,22 @@ class PokerEval:
                 E.g a pair has 2 appearances of the same rank
 
         Returns:
-            Tuple (Counter, List[Card]): A tuple (rank_counts, cards) where:
-            - rank_counts is a Counter object containing the rank and number of appearances,
+            Tuple (List[int], List[Card]): A tuple (rank_counts, cards) where:
+            - rank_counts is a list indexed by rank ID containing the number of appearances of each rank,
             - cards is a list of Card instances in the hand.
         """
-        rank_counts = Counter()
+        rank_counts = [0] * len(rank_map_id)
         cards = []
-        #Count appearances of each rank in the hand
+        #Count appearances of each rank in the hand. A card's ID encodes its rank as ID // 4
         for card in self.hand.cards:
-            rank_counts[card.rank] += 1
+            rank_counts[card.id // 4] += 1
 
         #Check for ranks that match the specified number
-        for key, value in rank_counts.items():
-            if value == num_of_cards_to_check: #If the rank count matches the hand type criteria
-                rank = key
+        for rank_id, count in enumerate(rank_counts):
+            if count == num_of_cards_to_check: #If the rank count matches the hand type criteria
                 #Collect cards in the hand that match the identified rank
                 for card in self.hand.cards:
-                    if card.rank == rank:
+                    if card.id // 4 == rank_id:
                         cards.append(card)
         return rank_counts, cards  #Return the rank counts and selected scoring cards
 
@@ -100,14 +159,10 @@ class PokerEval:
             return False, []
         #Sort the hand by rank in descending order.
         self.sort_hand_by_rank()
-        #Set test to one less than the highest card in the hand to see if the next cards are consecutive
-        test = rank_map_id[hand[0].rank] - 1
-        #Iterate through the remaining cards to check if each card is one rank lower than the previous.
-        for i in range(1, 5):
-            if rank_map_id[hand[i].rank] != test:
-                return False, []
-            test -= 1
-        return True, hand
+        #A card's ID encodes its rank as ID // 4, so the check only needs integers
+        if _is_consecutive_descending([card.id // 4 for card in hand[:5]]):
+            return True, hand
+        return False, []
 
     def is_royal_flush(self):
         is_straight_flush, flush_cards = self.is_straight_flush()
@@ -168,14 +223,13 @@ class PokerEval:
         if not valid:
             return False, []
 
-        _, three_of_a_kind_cards = self.get_cards_in_hand(3)
-        _, pair_cards = self.get_cards_in_hand(2)
-
-        #if there are cards in both lists this must mean that it is a full house
-        if three_of_a_kind_cards and pair_cards:
-            return True, three_of_a_kind_cards + pair_cards
-
-        return False, []
+        rank_counts, three_of_a_kind_cards = self.get_cards_in_hand(3)
+        #A full house has exactly one rank appearing three times and another appearing twice
+        if sorted(rank_counts, reverse=True)[:2] != [3, 2]:
+            return False, []
+        #Reuse the rank counts to collect the pair rather than counting the hand again
+        pair_cards = [card for card in hand if rank_counts[card.id // 4] == 2]
+        return True, three_of_a_kind_cards + pair_cards
 
     def is_three_of_a_kind(self):
         """
@@ -209,10 +263,10 @@ class PokerEval:
         if not valid:
             return False, []
 
-        _, two_pair_cards = self.get_cards_in_hand(2)
+        rank_counts, two_pair_cards = self.get_cards_in_hand(2)
 
         #If there are exactly 2 pairs, return True with these cards.
-        if len(two_pair_cards) == 4:
+        if rank_counts.count(2) == 2:
             return True, two_pair_cards
 
         return False, []
@@ -257,38 +311,34 @@ class PokerEval:
         """
         Determines the hand type of a hand and the cards that formed the hand.
 
+        The result is reused until the cards in the hand change.
+
         Returns:
             A tuple (hand_type, cards) where hand_type is a string describing the hand type,
             and cards is a list of cards.
         """
-        possible_hand_types_functions = []
-        possible_hand_types = []
-        if len(self.hand.cards) == 0:
+        #Card IDs are unique so the set of them identifies the hand regardless of its order
+        fingerprint = frozenset(card.id for card in self.hand.cards)
+        if self._last_eval is not None and self._last_eval[0] == fingerprint:
+            return self._last_eval[1], self._last_eval[2]
+        hand_type, hand_cards = self._evaluate_hand_type()
+        self._last_eval = (fingerprint, hand_type, hand_cards)
+        return hand_type, hand_cards
+
+    def _evaluate_hand_type(self):
+        """
+        Evaluates the hand type of a hand by checking each possible hand type in order.
+
+        Returns:
+            A tuple (hand_type, cards) where hand_type is a string describing the hand type,
+            and cards is a list of cards.
+        """
+        #Only the hand types that can be formed with this many cards are checked, highest ranked first
+        number_of_cards = len(self.hand.cards)
+        if number_of_cards >= len(_HAND_TYPE_CHECKS):
             return None, []
-        elif len(self.hand.cards) == 1:
-            #Only possible hand is "High Card"
-            return "High Card", self.hand.cards
-        elif len(self.hand.cards) == 2:
-            #Possible hands: "One Pair" or "High Card"
-            possible_hand_types_functions = [self.is_one_pair, self.is_high_card]
-            possible_hand_types = ["One Pair", "High Card"]
-        elif len(self.hand.cards) == 3:
-            #Possible hands: "Three of a Kind", "One Pair", or "High Card"
-            possible_hand_types_functions = [self.is_three_of_a_kind, self.is_one_pair, self.is_high_card]
-            possible_hand_types = ["Three of a Kind", "One Pair", "High Card"]
-        elif len(self.hand.cards) == 4:
-            #Possible hands: "Four of a Kind", "Three of a Kind", "Two Pair", "One Pair", or "High Card"
-            possible_hand_types_functions = [self.is_four_of_a_kind, self.is_three_of_a_kind, self.is_two_pair, self.is_one_pair, self.is_high_card]
-            possible_hand_types = ["Four of a Kind", "Three of a Kind", "Two Pair", "One Pair", "High Card"]
-        elif len(self.hand.cards) == 5:
-            #All hands are possible
-            possible_hand_types_functions = [self.is_royal_flush, self.is_straight_flush, self.is_four_of_a_kind, self.is_full_house, self.is_flush, self.is_straight, self.is_three_of_a_kind, self.is_two_pair, self.is_one_pair, self.is_high_card]
-            possible_hand_types = ["Royal Flush", "Straight Flush", "Four of a Kind", "Full House", "Flush", "Straight", "Three of a Kind", "Two Pair", "One Pair", "High Card"]
-
-        for i, check_function in enumerate(possible_hand_types_functions):
-            check_function = possible_hand_types_functions[i]
-            hand_type = possible_hand_types[i]
-            is_hand_type, hand_cards = check_function()
+        for hand_type, check in _HAND_TYPE_CHECKS[number_of_cards]:
+            is_hand_type, hand_cards = check(self)
             if is_hand_type:
                 return hand_type, hand_cards
         return None, []
@@ -303,28 +353,32 @@ class PokerEval:
         """
         return self.determine_hand_type()[0]
 
+#Entry i holds the (hand type, check function) pairs possible for a hand of i cards, highest ranked first
+_HAND_TYPE_CHECKS = (
+    (),
+    (("High Card", PokerEval.is_high_card),),
+    (("One Pair", PokerEval.is_one_pair), ("High Card", PokerEval.is_high_card)),
+    (("Three of a Kind", PokerEval.is_three_of_a_kind), ("One Pair", PokerEval.is_one_pair), ("High Card", PokerEval.is_high_card)),
+    (("Four of a Kind", PokerEval.is_four_of_a_kind), ("Three of a Kind", PokerEval.is_three_of_a_kind), ("Two Pair", PokerEval.is_two_pair),
+     ("One Pair", PokerEval.is_one_pair), ("High Card", PokerEval.is_high_card)),
+    (("Royal Flush", PokerEval.is_royal_flush), ("Straight Flush", PokerEval.is_straight_flush), ("Four of a Kind", PokerEval.is_four_of_a_kind),
+     ("Full House", PokerEval.is_full_house), ("Flush", PokerEval.is_flush), ("Straight", PokerEval.is_straight),
+     ("Three of a Kind", PokerEval.is_three_of_a_kind), ("Two Pair", PokerEval.is_two_pair), ("One Pair", PokerEval.is_one_pair),
+     ("High Card", PokerEval.is_high_card)),
+)
+
 class ScoringStrategy:
     """
     Base class for defining scoring strategies in the game.
 
-    This class provides a mapping of hand types to their base scores, multipliers, and levels.
+    This class provides a mapping of hand types to their levels. The base score and multiplier
+    of each hand type come from BASE_HAND_VALUES, adjusted by the level.
 
     Attributes:
-        base_hand_score_multiplier (dict): A dictionary mapping hand types to their score, multiplier, and level.
+        base_hand_score_multiplier (dict): A dictionary mapping hand types to their level.
     """
     def __init__(self):
-        self.base_hand_score_multiplier = {
-        "High Card": {"score": 5, "multiplier": 1, "level": 1},
-        "One Pair": {"score": 10, "multiplier": 2, "level": 1},
-        "Two Pair": {"score": 20, "multiplier": 3, "level": 1},
-        "Three of a Kind": {"score": 35, "multiplier": 3, "level": 1},
-        "Straight": {"score": 50, "multiplier": 4, "level": 1},
-        "Flush": {"score": 55, "multiplier": 4, "level": 1},
-        "Full House": {"score": 60, "multiplier": 4, "level": 1},
-        "Four of a Kind": {"score": 75, "multiplier": 6, "level": 1},
-        "Straight Flush": {"score": 100, "multiplier": 8, "level": 1},
-        "Royal Flush": {"score": 100, "multiplier": 10, "level": 1}
-    }
+        self.base_hand_score_multiplier = {hand_type: {"level": 1} for hand_type in BASE_HAND_VALUES}
 
 
     def calculate_score(self, hand_type, level):
@@ -427,9 +481,9 @@ class DefaultScoringStrategy(ScoringStrategy):
         Returns:
             int: The base score for the hand type, adjusted by level.
         """
-        #Add 20 score for each level above 1
+        #The level is part of the cache key so upgrading a hand never returns a stale score
         if hand_type:
-            return self.base_hand_score_multiplier[hand_type]["score"] + 20*(self.base_hand_score_multiplier[hand_type]["level"]-1)
+            return _base_score(hand_type, self.base_hand_score_multiplier[hand_type]["level"])
         return 0
 
     def get_base_multiplier(self, hand_type):
@@ -442,9 +496,8 @@ class DefaultScoringStrategy(ScoringStrategy):
         Returns:
             int: The base multiplier for the hand type, adjusted by level.
         """
-        #Add 1 mult for each level above 1
         if hand_type:
-            return self.base_hand_score_multiplier[hand_type]["multiplier"] + (self.base_hand_score_multiplier[hand_type]["level"]-1)
+            return _base_multiplier(hand_type, self.base_hand_score_multiplier[hand_type]["level"])
         return 0
 
     def upgrade_hand_level(self, hand):
@@ -8,7 +8,15 @@ from .CONSTANTS import (
     text_font,
     OFF_WHITE
 )
-from .ui import Text
+
+#Cumulative weights for each pouch rarity with the range of money it gives
+#Rarer pouches give more money: common 50%, uncommon 30%, rare 15%, ultra-rare 5%
+_RARITY_TABLE = (
+    (0.50, "common", 5, 10),
+    (0.80, "uncommon", 10, 15),
+    (0.95, "rare", 15, 20),
+    (1.00, "ultra-rare", 20, 25),
+)
 
 class RewardRoom():
     """
@@ -22,9 +30,13 @@ class RewardRoom():
         __bg (pygame.Surface): Background image for the reward room.
         __player (Player): The player object to update rewards.
         __pouch_image (pygame.Surface): The image of the pouch used to display rewards.
+        __pouch_rect (pygame.Rect): The area the pouch is drawn in, centred on the display and reused for click checks and redraws.
         reward_text (str): Text to display the reward message.
         reward_displayed (bool): Flag to track if the reward has been displayed.
+        _TEXT_CACHE (dict): Rendered reward message surfaces, keyed by the message text.
     """
+    _TEXT_CACHE = {}
+
     def __init__(self, display, bg, player):
         """
         Initialises the RewardRoom with display, background, and player.
@@ -35,15 +47,15 @@ class RewardRoom():
             player (Player): The player object associated with the reward room.
         """
         self.__display = display
-        self.__bg = bg
+        #Convert once to the display's pixel format so restoring regions of it is a plain copy
+        self.__bg = bg.convert()
         self.__player = player
         self.__pouch_image = pyg.image.load(os.path.join(image_path, "money_bag.png"))
         self.__pouch_image = pyg.transform.scale(self.__pouch_image, (DISPLAY_DIMENSIONS_X//5, DISPLAY_DIMENSIONS_Y//5))
+        self.__pouch_rect = self.__pouch_image.get_rect(center=(DISPLAY_DIMENSIONS_X // 2, DISPLAY_DIMENSIONS_Y // 2))
         self.reward_text = ""
         self.reward_displayed = False
-        self.__message_text = None
         self.__message_duration = 2000
-        self.__message_timer = 0
 
     def start_new_reward(self):
         """
@@ -52,6 +64,9 @@ class RewardRoom():
         This method will repeatedly call to display reward options until a reward has been successfully displayed.
         """
         self.reward_displayed = False
+        #Draw the whole room once, later frames only refresh the area around the pouch
+        self.__display.blit(self.__bg, (0, 0))
+        pyg.display.update()
         while not self.reward_displayed:
             self.display_reward_options()
             self.reward_displayed = self.handle_reward_events()
@@ -61,41 +76,25 @@ class RewardRoom():
         """
         Calculate the rewards based on the rarity level of the pouch.
 
-        Uses weighted random choices to determine the rarity of the pouch and calculates
+        Uses a cumulative weight table to determine the rarity of the pouch and calculates
         the reward amount.
 
         Returns:
             tuple: A tuple containing the amount of reward and the rarity level as a string.
         """
-        #Different weightings for different rarities
-        #Rarer pouches give more money
-        rarity = random.choices(
-            ["common", "uncommon", "rare", "ultra-rare"],
-            weights=[50, 30, 15, 5],
-            k=1)[0]
-        lower_limit = 5
-        upper_limit = 10
-        if rarity == "common":
-            #Common rewards give between 5 and 10
-            return random.randint(lower_limit,upper_limit), rarity
-        elif rarity == "uncommon":
-            #Uncommon rewards give between 10 and 15
-            return random.randint(lower_limit+5, upper_limit+5), rarity
-        elif rarity == "rare":
-            #Rare rewards give between 15 and 20
-            return random.randint(lower_limit+10, upper_limit+10), rarity
-        elif rarity == "ultra-rare":
-            #Ultra-rare rewards give between 20 and 25
-            return random.randint(lower_limit+15, upper_limit+15), rarity
+        #Walk the cumulative table until the random number falls within a rarity's band
+        random_num = random.random()
+        for cumulative_weight, rarity, lower_limit, upper_limit in _RARITY_TABLE:
+            if random_num < cumulative_weight:
+                return random.randint(lower_limit, upper_limit), rarity
 
     def display_reward_options(self):
         """Display the reward options on the screen, centered in the middle."""
-        #Clear background and display reward if not clicked
-        self.__display.blit(self.__bg, (0, 0))
+        #Clear the background behind the pouch and display reward if not clicked
+        self.__display.blit(self.__bg, self.__pouch_rect, self.__pouch_rect)
         if not self.reward_displayed:
-            self.__display.blit(self.__pouch_image, (DISPLAY_DIMENSIONS_X // 2 - self.__pouch_image.get_width() // 2,
-                                                DISPLAY_DIMENSIONS_Y // 2 - self.__pouch_image.get_height() // 2))
-        pyg.display.update()
+            self.__display.blit(self.__pouch_image, self.__pouch_rect)
+        pyg.display.update(self.__pouch_rect)
 
     def handle_reward_events(self):
         """
@@ -121,8 +120,7 @@ class RewardRoom():
         """
         #Check for click on image and display reward if so
         if event.type == pyg.MOUSEBUTTONDOWN and event.button == 1:
-            pouch_rect = self.__pouch_image.get_rect(center=(DISPLAY_DIMENSIONS_X // 2, DISPLAY_DIMENSIONS_Y // 2))
-            if pouch_rect.collidepoint(event.pos):
+            if self.__pouch_rect.collidepoint(event.pos):
                 self.display_reward()
 
     def display_reward(self):
@@ -132,16 +130,21 @@ class RewardRoom():
         This method retrieves a reward based on the pouch's rarity, updates the player's balance,
         and shows the reward message on the screen.
         """
-        self.__display.blit(self.__bg, (0, 0))
+        #Remove the pouch, the rest of the screen is still the background
+        self.__display.blit(self.__bg, self.__pouch_rect, self.__pouch_rect)
         reward_value, rarity = self.pouch_rewards()  #Adjust rarity as needed
         self.update_player(reward_value)
         self.reward_text = f"Reward: {reward_value}! (Rarity: {rarity.capitalize()})"
         self.reward_displayed = True
-        self.__message_text = Text(self.__display, OFF_WHITE, text_font(40), self.reward_text, DISPLAY_DIMENSIONS_X // 2, DISPLAY_DIMENSIONS_Y // 2)
-        self.__message_timer = pyg.time.get_ticks()
-        while self.__message_text and (pyg.time.get_ticks() - self.__message_timer < self.__message_duration):
-            self.__message_text.draw_self()
-            pyg.display.update()
+        #Reward messages repeat over a session so each one only needs to be rendered once
+        text_surface = RewardRoom._TEXT_CACHE.get(self.reward_text)
+        if text_surface is None:
+            text_surface = text_font(40).render(self.reward_text, True, OFF_WHITE)
+            RewardRoom._TEXT_CACHE[self.reward_text] = text_surface
+        text_rect = self.__display.blit(text_surface, (DISPLAY_DIMENSIONS_X // 2, DISPLAY_DIMENSIONS_Y // 2))
+        pyg.display.update([self.__pouch_rect, text_rect])
+        #The message is static so it only needs drawing once before waiting
+        pyg.time.delay(self.__message_duration)
 
     def update_player(self, reward_value):
         """
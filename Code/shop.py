@@ -15,6 +15,20 @@ from .CONSTANTS import (
 
 )
 
+#Button positions, the purchase and upgrade buttons sit in a row above the next button
+_NEXT_X = (DISPLAY_DIMENSIONS_X - 2 * (BUTTON_WIDTH + BUTTON_SPACING)) // 2
+_PURCHASE_X = _NEXT_X + BUTTON_WIDTH + BUTTON_SPACING
+_UPGRADE_X = int(DISPLAY_DIMENSIONS_X / 3.5)
+_BTN_Y = int(DISPLAY_DIMENSIONS_Y // 1.2)
+_UPPER_BTN_Y = _BTN_Y - 10 - BUTTON_HEIGHT
+#Where shop messages are shown, the upgrade message sits higher up and to the left
+_MESSAGE_POS = (DISPLAY_DIMENSIONS_X/2, DISPLAY_DIMENSIONS_Y/2 - CARD_DIMENSIONS[1]/8)
+_UPGRADE_MESSAGE_POS = (DISPLAY_DIMENSIONS_X/3, DISPLAY_DIMENSIONS_Y/3 - CARD_DIMENSIONS[1]/8)
+_MAX_JOKERS = 5
+#Area the player's joker hand is drawn in, sized for a full hand using the same gap between cards as JokerHand
+_JOKER_GAP = DISPLAY_DIMENSIONS_X // 192
+_JOKER_HAND_AREA = pyg.Rect(DISPLAY_DIMENSIONS_X // 4, DISPLAY_DIMENSIONS_Y // 10, _MAX_JOKERS * (CARD_DIMENSIONS[0] + _JOKER_GAP) - _JOKER_GAP, CARD_DIMENSIONS[1])
+
 class ShopRoom():
     """
     Class representing the shop room where players can purchase upgrades and Joker cards.
@@ -37,6 +51,14 @@ class ShopRoom():
         __hand_to_upgrade (str): The hand selected for upgrading.
         __joker_purchased (bool): Flag indicating if a Joker card has been purchased.
         __hand_upgraded (bool): Flag indicating if the hand has been upgraded.
+        __text_cache (dict): Message Text objects reused across shops, keyed by their text and position.
+        __small_font (pyg.font.Font): Font for the joker description and its buttons.
+        __font (pyg.font.Font): Font for the balance, messages and other buttons.
+        __dirty_rects (list): Areas of the display that have changed since the last update.
+        __message_text (Text): The message currently being shown, or None once it has expired.
+        __message_duration (int): How long a message is shown for, in milliseconds.
+        __message_expiry (int): The tick count at which the current message expires.
+        __shown_message (Text): The message that was last drawn, used to redraw its area when it changes or expires.
     """
     def __init__(self, display, bg, player, joker_deck, scoring_system):
         """
@@ -54,6 +76,10 @@ class ShopRoom():
         self.__player = player
         self.__joker_deck = joker_deck
         self.__scoring_system = scoring_system
+        self.__text_cache = {}
+        #Fonts are loaded once here as pygame is not initialised when this module is imported
+        self.__small_font = text_font(15)
+        self.__font = text_font(20)
 
 
     def setup_ui(self):
@@ -64,35 +90,36 @@ class ShopRoom():
         upgrading hands, and displaying player balance.
         """
         #Setup buttons and text
-        start_x = (DISPLAY_DIMENSIONS_X - 2 * (BUTTON_WIDTH + BUTTON_SPACING)) // 2
         self.__UIManager = UI(self.__display, x_pos=0, y_pos=0)
-        self.__purchase_joker_button = Button(self.__display, BUTTON_WIDTH, BUTTON_HEIGHT, (DISPLAY_DIMENSIONS_X - 2 * (BUTTON_WIDTH + BUTTON_SPACING)) // 2 + BUTTON_WIDTH + BUTTON_SPACING, DISPLAY_DIMENSIONS_Y // 1.2 - 10 - BUTTON_HEIGHT, "Purchase Joker", text_font(15), self.purchase_joker)
+        self.__purchase_joker_button = Button(self.__display, BUTTON_WIDTH, BUTTON_HEIGHT, _PURCHASE_X, _UPPER_BTN_Y, "Purchase Joker", self.__small_font, self.purchase_joker)
         self.__hand_to_upgrade = random.choice(list(self.__scoring_system.base_hand_score_multiplier.keys()))
 
-        next_button = Button(self.__display, BUTTON_WIDTH, BUTTON_HEIGHT, start_x , DISPLAY_DIMENSIONS_Y // 1.2, "Next", text_font(20), self.next)
+        next_button = Button(self.__display, BUTTON_WIDTH, BUTTON_HEIGHT, _NEXT_X, _BTN_Y, "Next", self.__font, self.next)
         text = f"Upgrade Hand: {self.__hand_to_upgrade}"
-        self.__upgrade_hand_button = Button(self.__display, 2*BUTTON_WIDTH, BUTTON_HEIGHT, DISPLAY_DIMENSIONS_X/ 3.5, DISPLAY_DIMENSIONS_Y // 1.2 - 10 - BUTTON_HEIGHT, text, text_font(20), self.upgrade_hand)
+        self.__upgrade_hand_button = Button(self.__display, 2*BUTTON_WIDTH, BUTTON_HEIGHT, _UPGRADE_X, _UPPER_BTN_Y, text, self.__font, self.upgrade_hand)
         #Randomly choose a joker from the tree
         self.__joker_to_buy = self.__joker_deck.weighted_select_joker()
         self.__joker_description = get_joker_description(self.__joker_to_buy._card_name)
-        self.__joker_text = Text(self.__display, OFF_WHITE, text_font(15), self.__joker_description, DISPLAY_DIMENSIONS_X/2 , DISPLAY_DIMENSIONS_Y/2 + CARD_DIMENSIONS[1])
+        self.__joker_text = Text(self.__display, OFF_WHITE, self.__small_font, self.__joker_description, DISPLAY_DIMENSIONS_X/2 , DISPLAY_DIMENSIONS_Y/2 + CARD_DIMENSIONS[1])
         #button will appear below joker
-        self.__sell_joker_button = Button(self.__display, BUTTON_WIDTH, BUTTON_HEIGHT, 0, 0, f"Sell Joker for value", text_font(15), self.sell_joker)
+        self.__sell_joker_button = Button(self.__display, BUTTON_WIDTH, BUTTON_HEIGHT, 0, 0, f"Sell Joker for value", self.__small_font, self.sell_joker)
         self.__joker_to_sell = None
         self.__player_balance = f"BALANCE: {str(self.__player.balance)}"
-        self.__balance_text = Text(self.__display, OFF_WHITE, text_font(20), self.__player_balance, DISPLAY_DIMENSIONS_X/2 , BUTTON_HEIGHT)
+        self.__balance_text = Text(self.__display, OFF_WHITE, self.__font, self.__player_balance, DISPLAY_DIMENSIONS_X/2 , BUTTON_HEIGHT)
 
         self.__UIManager.add_child(next_button)
         self.__UIManager.add_child(self.__joker_text)
         self.__UIManager.add_child(self.__balance_text)
         self.__UIManager.add_child(self.__upgrade_hand_button)
+        self.__dirty_rects = [self.__display.get_rect()] #Draw the whole shop the first time
 
         self.__joker_purchased = False
         self.__hand_upgraded = False
 
         self.__message_text = None
         self.__message_duration = 1000
-        self.__message_timer = 0
+        self.__message_expiry = 0
+        self.__shown_message = None
 
     def reset_items(self):
         """
@@ -123,6 +150,9 @@ class ShopRoom():
                 category.weight = category.base_weight * (1 + 0.01 * level)  #Increase rare weight by 1% each level
             elif category.rarity == "ultra-rare":
                 category.weight = category.base_weight * (1 + 0.005 * level)  #Increase ultra-rare weight by 0.5% each level
+            self.__joker_deck.update_weights(category)
+        #The alias table is built once from this level's weights by the first selection
+        self.__joker_deck.reset_alias_table()
 
         self.setup_ui()
         self.update_ui() #Load ui here because needs event to occur to update in loop
@@ -131,11 +161,15 @@ class ShopRoom():
     def shop_loop(self):
         """ Main loop for handling the shop's event processing and rendering."""
         while self.__running:
-            event_occured = self.handle_events()
-            if event_occured:
+            #Block until an event arrives instead of polling, then drain whatever else is queued.
+            #While a message is showing only wait about a frame so it is cleared once it expires
+            event = pyg.event.wait(16 if self.__message_text else 0)
+            events = pyg.event.get()
+            if event.type != pyg.NOEVENT:
+                events.insert(0, event)
+            event_occured = self.handle_events(events)
+            if event_occured or self.__message_text:
                 self.update_ui()
-            else:
-                continue
 
     def upgrade_hand(self):
         """
@@ -150,10 +184,8 @@ class ShopRoom():
             self.__player.balance = -UPGRADE_PRICE
             self.__scoring_system.upgrade_hand_level(self.__hand_to_upgrade)
             self.__hand_upgraded = True
-            self.__UIManager.remove_child(self.__upgrade_hand_button)
-            text = f"Upgraded {self.__hand_to_upgrade} for 2!"
-            self.__message_text = Text(self.__display, OFF_WHITE, text_font(20), text, DISPLAY_DIMENSIONS_X/3, DISPLAY_DIMENSIONS_Y/3- CARD_DIMENSIONS[1]/8)
-            self.__message_timer = pyg.time.get_ticks()
+            self.remove_ui(self.__upgrade_hand_button)
+            self._show_message(f"Upgraded {self.__hand_to_upgrade} for 2!", _UPGRADE_MESSAGE_POS)
 
     def purchase_joker(self):
         """
@@ -162,59 +194,77 @@ class ShopRoom():
         This method checks if the player can afford the Joker, processes the purchase,
         and updates the ui accordingly. Displays a success or failure message.
         """
-        if len(self.__player.joker_hand.cards) < 5: #Pllayer can have at most 5 joker cards
+        if len(self.__player.joker_hand.cards) < _MAX_JOKERS: #Pllayer can have at most 5 joker cards
             if self.__player.balance >= self.__joker_to_buy.price and not self.__joker_purchased:
                 #Update the balance and the player's joker cards
                 self.__player.balance = -self.__joker_to_buy.price #Pass in the negative value, setter in player will then minus it.
                 self.__player.joker_hand.add_joker(self.__joker_to_buy)
                 self.__joker_purchased = True
 
-                if self.__purchase_joker_button in self.__UIManager.children:
-                        self.__UIManager.remove_child(self.__purchase_joker_button)
-                if self.__joker_text in self.__UIManager._children:
-                    self.__UIManager.remove_child(self.__joker_text)
-                text = f"Purchased {self.__joker_to_buy._card_name} for {self.__joker_to_buy.price}!"
-                self.__message_text = Text(self.__display, OFF_WHITE, text_font(20), text, DISPLAY_DIMENSIONS_X/2, DISPLAY_DIMENSIONS_Y/2 - CARD_DIMENSIONS[1]/8)
-                self.__message_timer = pyg.time.get_ticks()
+                if self.__purchase_joker_button in self.__UIManager:
+                        self.remove_ui(self.__purchase_joker_button)
+                if self.__joker_text in self.__UIManager:
+                    self.remove_ui(self.__joker_text)
+                self.__dirty_rects.append(self.__joker_to_buy.rect)
+                self.__dirty_rects.append(_JOKER_HAND_AREA)
+                self._show_message(f"Purchased {self.__joker_to_buy._card_name} for {self.__joker_to_buy.price}!")
                 self.__joker_to_buy = None
             else:
-                text = "Insufficient balance!"
-                self.__message_text = Text(self.__display, OFF_WHITE, text_font(20), text, DISPLAY_DIMENSIONS_X/2, DISPLAY_DIMENSIONS_Y/2 - CARD_DIMENSIONS[1]/8)
-                self.__message_timer = pyg.time.get_ticks()
+                self._show_message("Insufficient balance!")
         else:
-            text = "Max joker limit reached!"
-            self.__message_text = Text(self.__display, OFF_WHITE, text_font(20), text, DISPLAY_DIMENSIONS_X/2, DISPLAY_DIMENSIONS_Y/2 - CARD_DIMENSIONS[1]/8)
-            self.__message_timer = pyg.time.get_ticks()
+            self._show_message("Max joker limit reached!")
+
+    def _show_message(self, text, pos=_MESSAGE_POS):
+        """
+        Shows a message for the message duration, only creating its Text the first time it is shown.
+
+        Parameters:
+            text (str): The message to display.
+            pos (tuple): The (x, y) coordinates of the message.
+        """
+        message_text = self.__text_cache.get((text, pos))
+        if message_text is None:
+            message_text = Text(self.__display, OFF_WHITE, self.__font, text, *pos)
+            self.__text_cache[(text, pos)] = message_text
+        self.__message_text = message_text
+        self.__message_expiry = pyg.time.get_ticks() + self.__message_duration
 
     def sell_joker(self):
         """Sells a joker, removing it from a player's hand and increases their balance"""
         self.__player.joker_hand.remove_joker(self.__joker_to_sell)
         self.__player.balance = self.__joker_to_sell._sell_value
-        if self.__sell_joker_button in self.__UIManager.children:
+        self.__dirty_rects.append(_JOKER_HAND_AREA)
+        if self.__sell_joker_button in self.__UIManager:
             self.__joker_to_sell = None
-            self.__UIManager.remove_child(self.__sell_joker_button)
+            self.remove_ui(self.__sell_joker_button)
 
 
     def next(self):
         """Closes the shop room. Returns back to the map"""
         self.__running = False
 
-    def handle_events(self):
+    def handle_events(self, events):
         """
         Handles events within the shop room.
 
         This method processes mouse button events and triggers actions accordingly.
 
+        Parameters:
+            events (list): The pygame events to process.
+
         Returns:
             bool: Returns True if an event was handled, otherwise False.
         """
-        for event in pyg.event.get():
+        event_handled = False
+        for event in events:
             if event.type == pyg.MOUSEBUTTONUP and event.button == 1:
-                mouse_pos = pyg.mouse.get_pos()
-                self.handle_click_on_joker(mouse_pos)
-                self.handle_event(pyg.event.Event(pyg.MOUSEBUTTONDOWN, pos=mouse_pos, button=1))
-                return True
-            return False
+                self.handle_click_on_joker(event.pos)
+                self.handle_event(pyg.event.Event(pyg.MOUSEBUTTONDOWN, pos=event.pos, button=1))
+                event_handled = True
+                #The next button closes the shop so ignore any clicks queued after it
+                if not self.__running:
+                    break
+        return event_handled
 
     def handle_click_on_joker(self, mouse_pos):
         """
@@ -228,24 +278,24 @@ class ShopRoom():
         #Check for click on the joker to buy image
         if self.__joker_to_buy:
             if self.__joker_to_buy.rect.collidepoint(mouse_pos) and not self.__joker_purchased:
-                if self.__purchase_joker_button in self.__UIManager.children:
-                    self.__UIManager.remove_child(self.__purchase_joker_button)
+                if self.__purchase_joker_button in self.__UIManager:
+                    self.remove_ui(self.__purchase_joker_button)
                 else:
-                    self.__UIManager.add_child(self.__purchase_joker_button)
+                    self.add_ui(self.__purchase_joker_button)
                 return
 
         #Check for click on joker cards in the player's hand
         for joker in self.__player.joker_hand.cards:
             if joker.rect.collidepoint(mouse_pos):
-                self.__sell_joker_button.set_text(f"Sell Joker for {joker._sell_value}")
-                self.__sell_joker_button.x_pos = joker.x
-                self.__sell_joker_button.y_pos = joker.y + BUTTON_HEIGHT + 100
-                if self.__sell_joker_button in self.__UIManager.children:
+                if self.__sell_joker_button in self.__UIManager:
                     self.__joker_to_sell = None
-                    self.__UIManager.remove_child(self.__sell_joker_button)
+                    self.remove_ui(self.__sell_joker_button)
                 else:
+                    self.__sell_joker_button.set_text(f"Sell Joker for {joker._sell_value}")
+                    self.__sell_joker_button.x_pos = joker.x
+                    self.__sell_joker_button.y_pos = joker.y + BUTTON_HEIGHT + 100
                     self.__joker_to_sell = joker
-                    self.__UIManager.add_child(self.__sell_joker_button)
+                    self.add_ui(self.__sell_joker_button)
                 return
 
     def handle_event(self, event):
@@ -255,27 +305,82 @@ class ShopRoom():
         Parameters:
             event (pygame.event.Event): The event to be handled.
         """
-        for child in self.__UIManager.children:
-                child.handle_event(event)
+        self.__UIManager.handle_event(event)
+
+    def add_ui(self, child):
+        """
+        Adds a UI element to the shop and marks the area it covers to be drawn.
+
+        Parameters:
+            child (UI): The UI element to add.
+        """
+        self.__UIManager.add_child(child)
+        self.__dirty_rects.append(child.rect)
+
+    def remove_ui(self, child):
+        """
+        Removes a UI element from the shop and marks the area it covered to be redrawn.
+
+        Parameters:
+            child (UI): The UI element to remove.
+        """
+        self.__UIManager.remove_child(child)
+        self.__dirty_rects.append(child.rect)
 
     def update_ui(self):
         """
         Updates the ui for the shop room.
 
-        This method redraws the background, updates the balance text,
-        and renders all UI elements.
+        This method works out which areas of the shop have changed, redraws the
+        background and ui elements in only those areas and updates them on the screen.
+        """
+        current_balance = f"BALANCE: {str(self.__player.balance)}"
+        #Only update the balance text when the balance has actually changed
+        if current_balance != self.__player_balance:
+            self.__player_balance = current_balance
+            self.__balance_text.set_text(current_balance)
+        #Redraw where any changed ui element was and where it is now
+        self.__UIManager.collect_dirty_rects(self.__dirty_rects)
+
+        #Drop the message once it has expired so later updates skip the timer check
+        if self.__message_text and pyg.time.get_ticks() >= self.__message_expiry:
+            self.__message_text = None
+        message = self.__message_text
+        #Redraw where the message was and where the new one is when it has changed or expired
+        if message is not self.__shown_message:
+            if self.__shown_message:
+                self.__dirty_rects.append(self.__shown_message.rect)
+            if message:
+                self.__dirty_rects.append(message.rect)
+            self.__shown_message = message
+
+        if not self.__dirty_rects:
+            return
+        for rect in self.__dirty_rects:
+            #Clip to the dirty area so only the pixels in it are touched
+            self.__display.set_clip(rect)
+            self.draw_area(rect)
+        self.__display.set_clip(None)
+        pyg.display.update(self.__dirty_rects)
+        self.__dirty_rects = []
+
+    def draw_area(self, rect):
+        """
+        Redraws everything in the shop that overlaps an area of the display.
+
+        Parameters:
+            rect (pyg.Rect): The area of the display to redraw.
         """
-        self.__display.blit(self.__bg, (0, 0))
+        self.__display.blit(self.__bg, rect, rect)
         if not self.__joker_purchased:
             self.__joker_to_buy.x = DISPLAY_DIMENSIONS_X/2
             self.__joker_to_buy.y = DISPLAY_DIMENSIONS_Y/2
-            self.__display.blit(self.__joker_to_buy.image, (DISPLAY_DIMENSIONS_X/2, DISPLAY_DIMENSIONS_Y/2))
-        self.__player.joker_hand.display_hand(DISPLAY_DIMENSIONS_X // 4, DISPLAY_DIMENSIONS_Y // 10)
-        current_balance = f"BALANCE: {str(self.__player.balance)}"
-
-        if self.__message_text and (pyg.time.get_ticks() - self.__message_timer < self.__message_duration):
-            self.__message_text.draw_self()
-        self.__balance_text.set_text(current_balance)
-        self.__UIManager.draw()
-        pyg.display.update()
-
+            if self.__joker_to_buy.rect.colliderect(rect):
+                self.__display.blit(self.__joker_to_buy.image, (DISPLAY_DIMENSIONS_X/2, DISPLAY_DIMENSIONS_Y/2))
+        if _JOKER_HAND_AREA.colliderect(rect):
+            self.__player.joker_hand.display_hand(DISPLAY_DIMENSIONS_X // 4, DISPLAY_DIMENSIONS_Y // 10)
+        if self.__shown_message and self.__shown_message.rect.colliderect(rect):
+            self.__shown_message.draw_self()
+        for child in self.__UIManager.children:
+            if child.rect.colliderect(rect):
+                child.draw_self()
@@ -13,8 +13,27 @@ class UI:
         _height (int): The height of the UI element.
         _x_pos (int): The x coordinate of the UI element's position.
         _y_pos (int): The y coordinate of the UI element's position.
-        __children (list): A list of child UI elements.
+        _children (list): A list of child UI elements, or None until the first child is added.
+        _child_set (set): The child UI elements, for fast membership checks, or None until the first child is added.
+        _text_surface (pyg.Surface): The last rendered text, reused until the text or colour changes.
+        _font (pyg.font.Font): The font used for any text, set by subclasses that display text.
+        _text_size (tuple): The (width, height) of the text measured with the font, updated whenever the text changes.
+        _text_cache_key (tuple): The (text, colour) pair the cached text surface was rendered from.
+        _text_pos (tuple): The cached position of the rendered text, cleared when the element moves or resizes.
+        _box_surface (pyg.Surface): The element's box with its text already drawn on, reused until the text or size changes.
+        _text_overflows (bool): Whether the text spills past the box, in which case it is drawn separately on top of it.
+        _dirty (bool): Whether the element has changed since it was last drawn.
+        _drawn_rect (pyg.Rect): The area the element covered when it was last drawn, or None if it has not been drawn.
+        _event_dispatch (dict): The children interested in each event type, or None until the first child is added.
+        _parent (UI): The UI element this one is a child of, or None if it has not been added to one.
+        _render_list (list): The blits that draw this element and everything below it, or None when the tree has changed.
+        INTERESTED_EVENTS (tuple): The event types a UI element responds to.
     """
+    INTERESTED_EVENTS = ()
+    __slots__ = ('_display', '_width', '_height', '_x_pos', '_y_pos', '_children', '_child_set', '_text', '_font', '_text_size',
+                 '_text_surface', '_text_cache_key', '_text_pos', '_box_surface', '_text_overflows', '_dirty',
+                 '_drawn_rect', '_event_dispatch', '_parent', '_render_list')
+
     def __init__(self, display, x_pos, y_pos):
         """
         Initialises the UI component with display surface and position.
@@ -29,16 +48,41 @@ class UI:
         self._height = DISPLAY_DIMENSIONS_Y
         self._x_pos = x_pos
         self._y_pos = y_pos
-        self._children = []
+        #Most UI elements never have children, so the containers are only made when the first one is added
+        self._children = None
+        self._child_set = None
         self._text = None
+        self._font = None
+        self._text_size = (0, 0)
+        self._text_surface = None
+        self._text_cache_key = None
+        self._text_pos = None
+        self._box_surface = None
+        self._text_overflows = False
+        self._dirty = True
+        self._drawn_rect = None
+        self._event_dispatch = None
+        self._parent = None
+        self._render_list = None
+
     def add_child(self, child):
         """
-        Add a child UI element to this UI component.
+        Add a child UI element to this UI component. A child that is already added is ignored.
 
         Parameters:
             child (UI): The child UI element to add.
         """
-        self._children.append(child)
+        if self._children is None:
+            self._children = []
+            self._child_set = set()
+            self._event_dispatch = {}
+        if child not in self._child_set:
+            self._child_set.add(child)
+            self._children.append(child)
+            for event_type in child.INTERESTED_EVENTS:
+                self._event_dispatch.setdefault(event_type, []).append(child)
+            child._parent = self
+            self._invalidate_render_list()
 
     def remove_child(self, child):
         """
@@ -47,26 +91,114 @@ class UI:
         Parameters:
             child (UI): The child UI element to remove.
         """
+        if self._children is None:
+            raise ValueError("UI.remove_child(child): child is not a child of this UI element")
         self._children.remove(child)
+        self._child_set.discard(child)
+        for event_type in child.INTERESTED_EVENTS:
+            self._event_dispatch[event_type].remove(child)
+        child._parent = None
+        self._invalidate_render_list()
+
+    def __contains__(self, child):
+        """
+        Check whether a UI element is a child of this UI component.
+
+        Parameters:
+            child (UI): The UI element to look for.
+
+        Returns:
+            bool: True if the element is a child, otherwise False.
+        """
+        return self._child_set is not None and child in self._child_set
 
     def draw(self):
-        """Draw the UI element and all its children on the display."""
-        self.draw_self()
+        """Draw the UI element and everything below it on the display with a single batched blit."""
+        render_list = self._render_list
+        if render_list is None:
+            #Only walk the tree again when something in it has changed since the last draw
+            render_list = self._render_list = []
+            self._collect_tree_blits(render_list)
+        self._display.blits(render_list, doreturn=False)
+
+    def _invalidate_render_list(self):
+        """Drop the render lists of this UI element and its ancestors so they are rebuilt on their next draw."""
+        node = self
+        while node is not None:
+            node._render_list = None
+            node = node._parent
+
+    def _mark_dirty(self):
+        """Mark the UI element as changed since it was last drawn."""
+        self._dirty = True
+        self._invalidate_render_list()
+
+    def _collect_tree_blits(self, out):
+        """
+        Add the blits for this UI element and, recursively, all of its descendants to a list, marking changed children as drawn.
+
+        Parameters:
+            out (list): The list of blits being collected for the display.
+        """
+        self.collect_blits(out)
+        children = self._children
+        if children:
+            for child in children:
+                child._collect_tree_blits(out)
+                if child._dirty:
+                    child._mark_drawn()
+
+    def collect_dirty_rects(self, out):
+        """
+        Add the areas of the display that need redrawing because a child has changed since it was last drawn,
+        covering both where it was and where it is now. The children are then treated as drawn.
+
+        Parameters:
+            out (list): The list of dirty rectangles being collected.
+
+        Returns:
+            list: The same list, with the dirty rectangles added.
+        """
+        if not self._children:
+            return out
         for child in self._children:
-            child.draw_self()
+            if child._dirty:
+                if child._drawn_rect is not None:
+                    out.append(child._drawn_rect)
+                child._mark_drawn()
+                out.append(child._drawn_rect)
+        return out
+
+    def _mark_drawn(self):
+        """Record the area the element now covers and mark it as clean."""
+        self._drawn_rect = pyg.Rect(self.rect)
+        self._dirty = False
 
     def draw_self(self):
-        """Protected method to be overridden by subclasses to draw the specific UI element."""
+        """Draw just this UI element, passing the blits it collects to a single display.blits call."""
+        blit_list = []
+        self.collect_blits(blit_list)
+        self._display.blits(blit_list, doreturn=False)
+
+    def collect_blits(self, out):
+        """
+        Add the (surface, position) pairs that draw this UI element to a list, to be overridden by subclasses.
+
+        Parameters:
+            out (list): The list of blits being collected for the display.
+        """
         pass
 
     def handle_event(self, event):
         """
-        Iterates through all the children so they can handle an event.
+        Passes an event to the children interested in its type so they can handle it.
 
         Parameters:
             event (pygame.event.Event): The event to handle.
         """
-        for child in self._children:
+        if not self._event_dispatch:
+            return
+        for child in self._event_dispatch.get(event.type, ()):
             child.handle_event(event)
 
     def set_text(self, text):
@@ -76,9 +208,107 @@ class UI:
         Parameters:
             text (str): The text to display.
         """
+        #Callers often set the same text every frame, so keep the cached surfaces when nothing has changed
+        if text == self._text:
+            return
         self._text = text
-        if text == None:
-            return 0
+        #A plain UI element has no font, so there is no text to measure or render
+        if self._font is None:
+            return
+        self._text_surface = None
+        self._box_surface = None
+        self._text_pos = None
+        self._mark_dirty()
+        #Measure the text now so it can be positioned without waiting for it to be rendered
+        self._text_size = (0, 0) if text is None else self._font.size(text)
+
+    def _geometry_changed(self):
+        """Protected hook called after the position or size changes, extended by subclasses that keep their own rectangle."""
+        self._text_pos = None
+        self._mark_dirty()
+
+    def _render_text(self, colour):
+        """
+        Get the rendered text surface, only rendering it again when the text or colour has changed.
+
+        Parameters:
+            colour (pyg.Color): The colour to render the text in.
+
+        Returns:
+            pyg.Surface: The rendered text.
+        """
+        text_surface = self._text_surface
+        key = (self._text, colour)
+        if text_surface is None or self._text_cache_key != key:
+            text_surface = self._font.render(self._text, True, colour)
+            if pyg.display.get_surface() is not None:
+                text_surface = text_surface.convert_alpha() #Match the display's pixel format so blits skip the conversion
+            self._text_surface = text_surface
+            self._text_cache_key = key
+            self._text_pos = None
+        return text_surface
+
+    def _place_text(self):
+        """
+        Protected method to be overridden by subclasses to position their text, using its measured size.
+
+        Returns:
+            tuple: The top left position to draw the text at.
+        """
+        return (self._x_pos, self._y_pos)
+
+    def _text_blit(self, colour):
+        """
+        Get the rendered text and where to draw it, both cached until they change.
+
+        Parameters:
+            colour (pyg.Color): The colour to render the text in.
+
+        Returns:
+            tuple: The text surface and its top left position.
+        """
+        text_surface = self._render_text(colour)
+        if self._text_pos is None:
+            self._text_pos = self._place_text()
+        return text_surface, self._text_pos
+
+    def _build_box_surface(self, box_colour, text_colour):
+        """
+        Draw the box and its text onto a single surface so it can be drawn with one blit.
+
+        Parameters:
+            box_colour (pyg.Color): The colour of the box.
+            text_colour (pyg.Color): The colour of the text.
+        """
+        text_surface, text_pos = self._text_blit(text_colour)
+        offset = (text_pos[0] - self._x_pos, text_pos[1] - self._y_pos)
+        self._box_surface = pyg.Surface((self._width, self._height))
+        if pyg.display.get_surface() is not None:
+            self._box_surface = self._box_surface.convert()
+        self._box_surface.fill(box_colour)
+        self._text_overflows = not self._box_surface.get_rect().contains(text_surface.get_rect(topleft=offset))
+        if not self._text_overflows:
+            self._box_surface.blit(text_surface, offset)
+
+    def _box_blits(self, box_colour, text_colour):
+        """
+        Get the blits that draw the box and its text, building the composited surface if it is out of date.
+
+        Parameters:
+            box_colour (pyg.Color): The colour of the box.
+            text_colour (pyg.Color): The colour of the text.
+
+        Returns:
+            tuple: The (surface, position) pairs to draw, with the text separate only if it overflows the box.
+        """
+        box_surface = self._box_surface
+        if box_surface is None:
+            self._build_box_surface(box_colour, text_colour)
+            box_surface = self._box_surface
+        box_blit = (box_surface, (self._x_pos, self._y_pos))
+        if self._text_overflows:
+            return box_blit, self._text_blit(text_colour)
+        return (box_blit,)
 
     @property
     def display(self):
@@ -109,6 +339,8 @@ class UI:
             width (int): The new width to set for the UI elements.
         """
         self._width = width
+        self._box_surface = None #The box has to be built again at the new size
+        self._geometry_changed()
 
     @property
     def height(self):
@@ -129,6 +361,8 @@ class UI:
             height (int): The new height to set for the UI element.
         """
         self._height = height
+        self._box_surface = None #The box has to be built again at the new size
+        self._geometry_changed()
 
     @property
     def x_pos(self):
@@ -149,6 +383,7 @@ class UI:
             x_pos (int): The new x-coordinate for the UI element.
         """
         self._x_pos = x_pos
+        self._geometry_changed()
 
     @property
     def y_pos(self):
@@ -169,6 +404,7 @@ class UI:
             y_pos (int): The new y-coordinate for the UI element.
         """
         self._y_pos = y_pos
+        self._geometry_changed()
 
     @property
     def children(self):
@@ -176,10 +412,22 @@ class UI:
         Get the list of child UI elements.
 
         Returns:
-            list: A list containing the child UI elements associated with this UI component.
+            list: A list containing the child UI elements associated with this UI component, or an empty tuple if it has none.
         """
+        if self._children is None:
+            return ()
         return self._children
 
+    @property
+    def rect(self):
+        """
+        Get the rectangle covering the UI element's current position and size.
+
+        Returns:
+            pyg.Rect: The area of the display occupied by the UI element.
+        """
+        return pyg.Rect(self._x_pos, self._y_pos, self._width, self._height)
+
 
 class Button(UI):
     """
@@ -193,6 +441,9 @@ class Button(UI):
         _font (pygame.font.Font): The font used for the button text.
         _action (function): The function to call when the button is clicked.
     """
+    INTERESTED_EVENTS = (pyg.MOUSEBUTTONDOWN,)
+    __slots__ = ('_button', '_action')
+
     def __init__(self, display, width, height, x_pos, y_pos, text, font, action):
         """
         Initialise a Button instance.
@@ -208,26 +459,47 @@ class Button(UI):
             action (function): The function to be called when the button is clicked.
         """
         super().__init__(display, x_pos, y_pos)
+        self._button = pyg.Rect(x_pos, y_pos, width, height)
         self.width = width
         self.height = height
-        self._text = text
-        self._button = pyg.Rect(self.x_pos, self.y_pos, self.width, self.height)
         self._font = font
+        self.set_text(text)
         self._action = action
 
     @override
-    def draw_self(self):
-        self._button = pyg.Rect(self.x_pos, self.y_pos, self.width, self.height) #If position of button changes then the rectangle changes pos
-        pyg.draw.rect(self.display, ROYAL_BLUE, self._button)
-        text_surface = self._font.render(self._text, True, OFF_WHITE)
-        text_rect = text_surface.get_rect(center=(self.x_pos + self.width // 2, self.y_pos + self.height // 2))
-        self.display.blit(text_surface, text_rect)
+    def collect_blits(self, out):
+        out.extend(self._box_blits(ROYAL_BLUE, OFF_WHITE))
+
+    @override
+    def _place_text(self):
+        text_width, text_height = self._text_size
+        x, y, width, height = self._x_pos, self._y_pos, self._width, self._height
+        return (x + width // 2 - text_width // 2, y + height // 2 - text_height // 2)
+
+    @override
+    def _geometry_changed(self):
+        super()._geometry_changed()
+        self._button.update(self._x_pos, self._y_pos, self._width, self._height) #Move the rectangle in place rather than building a new one
 
     @override
     def handle_event(self, event):
-        if event.type == pyg.MOUSEBUTTONDOWN and event.button == 1:
-            if (self.x_pos <= event.pos[0] <= self.x_pos + self.width) and (self.y_pos <= event.pos[1] <= self.y_pos + self.height):
-                return self._action()
+        if event.type != pyg.MOUSEBUTTONDOWN or event.button != 1:
+            return None
+        if self._button.collidepoint(event.pos):
+            return self._action()
+
+    @property
+    def rect(self):
+        """
+        Get the rectangle covering the button and its text.
+
+        Returns:
+            pyg.Rect: The area of the display occupied by the button.
+        """
+        box = pyg.Rect(self._x_pos, self._y_pos, self._width, self._height)
+        text_rect = pyg.Rect((0, 0), self._text_size)
+        text_rect.center = box.center
+        return box.union(text_rect) #Long text can spill past the edges of the button
 
     @property
     def button(self):
@@ -253,26 +525,35 @@ class TextRect(UI):
         _rect (pygame.Rect): The rectangle representing the text box's position and size.
         _text (str): The text to display.
     """
+    __slots__ = ('_rect', '_box_colour', '_text_colour')
+
     def __init__(self, display, width, height, x_pos, y_pos, font, box_colour, text_colour, text):
         super().__init__(display, x_pos, y_pos)
+        self._rect = pyg.Rect(x_pos, y_pos, width, height)
         self.width = width
         self.height = height
         self._box_colour = box_colour
         self._text_colour = text_colour
         self._font = font
-        self._rect = pyg.Rect(self.x_pos, self.y_pos, self.width, self.height)
-        self._text = text
+        self.set_text(text)
 
-    def draw_self(self):
+    def collect_blits(self, out):
         """
-        Draw the text rectangle and its text on the display.
+        Add the blits that draw the text rectangle and its text to a list.
+
+        Parameters:
+            out (list): The list of blits being collected for the display.
         """
-        pyg.draw.rect(self.display, self._box_colour, self._rect)
-        text_surface = self._font.render(self._text, True, self._text_colour)
-        text_width, text_height = text_surface.get_size()
-        text_x = self.x_pos + (self.width - text_width) // 2
-        text_y = self.y_pos + (self.height - text_height) // 2
-        self.display.blit(text_surface, (text_x, text_y))
+        out.extend(self._box_blits(self._box_colour, self._text_colour))
+
+    def _place_text(self):
+        text_width, text_height = self._text_size
+        x, y, width, height = self._x_pos, self._y_pos, self._width, self._height
+        return (x + (width - text_width) // 2, y + (height - text_height) // 2)
+
+    def _geometry_changed(self):
+        super()._geometry_changed()
+        self._rect.update(self._x_pos, self._y_pos, self._width, self._height)
 
     def handle_event(self, event):
         pass
@@ -295,20 +576,32 @@ class Text(UI):
         _font (pygame.font.Font): The font used for the text.
         _text (str): The text to display.
     """
+    __slots__ = ('_text_colour',)
+
     def __init__(self, display, text_colour, font, text, x_pos, y_pos):
         super().__init__(display, x_pos, y_pos)
-        self._width = 0
-        self._height = 0
         self._text_colour = text_colour
         self._font = font
-        self._text = text
+        self.set_text(text)
 
-    def draw_self(self):
-        """Draw the text on the display for 1 second."""
-        text_surface = self._font.render(self._text, True, self._text_colour)
-        self._width, self._height = text_surface.get_size()
-        self.display.blit(text_surface, (self._x_pos, self._y_pos))
-        pyg.display.update()
+    def set_text(self, text):
+        """
+        Set the text to display, sizing the element to fit it.
+
+        Parameters:
+            text (str): The text to display.
+        """
+        super().set_text(text)
+        self._width, self._height = self._text_size
+
+    def collect_blits(self, out):
+        """
+        Add the blit that draws the text to a list. The caller is responsible for updating the display afterwards.
+
+        Parameters:
+            out (list): The list of blits being collected for the display.
+        """
+        out.append(self._text_blit(self._text_colour))
 
     def handle_event(self, event):
         pass